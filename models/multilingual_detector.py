@@ -2,10 +2,24 @@
 import pandas as pd
 import numpy as np
 import re
+from concurrent.futures import ThreadPoolExecutor, wait
 from googletrans import Translator
 import requests
 import json
 
+try:
+    from httpx import HTTPError as _HTTPError  # googletrans' HTTP client
+except ImportError:
+    _HTTPError = OSError
+
+# Deadline for all batched translate requests together, in seconds
+TRANSLATE_TIMEOUT = 5
+
+# Network failures a translate request may raise: HTTP errors and timeouts from
+# httpx, and socket errors (OSError, which includes TimeoutError). Anything else
+# is a bug and should surface
+_TRANSLATE_ERRORS = (_HTTPError, OSError)
+
 class BhashiniMultilingualDetector:
     """
     Integration with India's Bhashini AI for 22 Indian languages
@@ -25,12 +39,19 @@ class BhashiniMultilingualDetector:
             'bodo': 'Bodo', 'sanskrit': 'Sanskrit'
         }
         
-        # Language-specific threat keywords
-        self.threat_keywords = self._load_threat_keywords()
+        # Language-specific threat keywords: ordered lists for text scans and
+        # reporting, frozensets for token lookups
+        self._threat_keyword_lists = self._load_threat_keywords()
+        self.threat_keywords = {
+            lang: frozenset(words) for lang, words in self._threat_keyword_lists.items()
+        }
         
         # Regional slang and coded language patterns
         self.regional_slang = self._load_regional_slang()
         
+        # Sarcasm indicators and regional terms, loaded once instead of per call
+        self.sarcasm_indicators, self.regional_terms = self._load_cultural_markers()
+        
     def _load_threat_keywords(self):
         """Load threat keywords in multiple Indian languages"""
         return {
@@ -68,6 +89,18 @@ class BhashiniMultilingualDetector:
             }
         }
     
+    def _load_cultural_markers(self):
+        """Load sarcasm indicators and regional reference terms"""
+        sarcasm_indicators = ['वाह', 'बहुत अच्छे', 'சூப்பர்', 'अरे वाह']  # Wow, very good, super, oh wow
+        
+        regional_terms = {
+            'hi': ['दिल्ली', 'मुंबई', 'यूपी', 'बिहार'],
+            'ta': ['சென்னை', 'கோவை', 'மதுரை', 'தமிழ்நாடு'],
+            'ml': ['തിരുവനന്തപുരം', 'കൊച്ചി', 'കോഴിക്കോട്', 'കേരളം']
+        }
+        
+        return sarcasm_indicators, regional_terms
+    
     def detect_language(self, text):
         """Detect language of text"""
         try:
@@ -104,7 +137,44 @@ class BhashiniMultilingualDetector:
             # Fallback: simple keyword matching
             return text
     
-    def analyze_regional_text(self, text, language_code):
+    def translate_batch(self, texts, source_lang):
+        """Translate a list of texts in one language with a single request"""
+        translations = self.translator.translate(texts, src=source_lang, dest='en')
+        return [translation.text for translation in translations]
+    
+    def _translate_by_language(self, texts_by_lang):
+        """Translate each language's batch concurrently"""
+        if not texts_by_lang:
+            return {}
+        
+        # Translation is network-bound, so overlap the per-language requests
+        executor = ThreadPoolExecutor(max_workers=min(8, len(texts_by_lang)))
+        futures = {
+            lang: executor.submit(self.translate_batch, texts, lang)
+            for lang, texts in texts_by_lang.items()
+        }
+        
+        # One deadline for every request, not one timeout per language
+        wait(futures.values(), timeout=TRANSLATE_TIMEOUT)
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        translated = {}
+        for lang, future in futures.items():
+            texts = texts_by_lang[lang]
+            if not future.done() or future.cancelled():
+                # Still in flight: don't add load by asking again, keep the
+                # untranslated text as translate_to_english does on failure
+                translated[lang] = list(texts)
+                continue
+            try:
+                translated[lang] = future.result()
+            except _TRANSLATE_ERRORS:
+                # Only this language's batch failed; retry its texts one by one
+                translated[lang] = [self.translate_to_english(text, lang) for text in texts]
+        
+        return translated
+    
+    def analyze_regional_text(self, text, language_code, translated=None):
         """Analyze regional text for threats"""
         results = {
             'detected_language': self.indian_languages.get(language_code, 'Unknown'),
@@ -115,16 +185,16 @@ class BhashiniMultilingualDetector:
             'cultural_context': {}
         }
         
-        # Translate to English
-        translated = self.translate_to_english(text, language_code)
+        # Translate to English (unless already batch-translated)
+        if translated is None:
+            translated = self.translate_to_english(text, language_code)
         results['translated_text'] = translated
         
         # Check for threat keywords
-        if language_code in self.threat_keywords:
-            for keyword in self.threat_keywords[language_code]:
-                if keyword in text:
-                    results['threat_keywords_found'].append(keyword)
-                    results['threat_score'] += 5
+        if language_code in self._threat_keyword_lists:
+            found = [keyword for keyword in self._threat_keyword_lists[language_code] if keyword in text]
+            results['threat_keywords_found'] = found
+            results['threat_score'] += 5 * len(found)
         
         # Check for coded language
         if language_code in self.regional_slang:
@@ -146,6 +216,15 @@ class BhashiniMultilingualDetector:
         
         return results
     
+    def analyze_tokens(self, tokens, language_code):
+        """Match already-tokenized text against the threat keywords"""
+        hits = set(tokens) & self.threat_keywords.get(language_code, frozenset())
+        
+        return {
+            'threat_keywords_found': sorted(hits),
+            'threat_score': 5 * len(hits)
+        }
+    
     def _analyze_cultural_context(self, text, language_code):
         """Analyze cultural and contextual meaning"""
         context = {
@@ -155,22 +234,16 @@ class BhashiniMultilingualDetector:
         }
         
         # Simple sarcasm detection (can be enhanced)
-        sarcasm_indicators = ['वाह', 'बहुत अच्छे', 'சூப்பர்', 'अरे वाह']  # Wow, very good, super, oh wow
-        for indicator in sarcasm_indicators:
+        for indicator in self.sarcasm_indicators:
             if indicator in text:
                 context['sarcasm_detected'] = True
+                break
         
         # Regional references
-        regional_terms = {
-            'hi': ['दिल्ली', 'मुंबई', 'यूपी', 'बिहार'],
-            'ta': ['சென்னை', 'கோவை', 'மதுரை', 'தமிழ்நாடு'],
-            'ml': ['തിരുവനന്തപുരം', 'കൊച്ചി', 'കോഴിക്കോട്', 'കേരളം']
-        }
-        
-        if language_code in regional_terms:
-            for term in regional_terms[language_code]:
-                if term in text:
-                    context['regional_references'].append(term)
+        if language_code in self.regional_terms:
+            context['regional_references'] = [
+                term for term in self.regional_terms[language_code] if term in text
+            ]
         
         return context
     
@@ -179,12 +252,23 @@ class BhashiniMultilingualDetector:
         if 'post' not in dataframe.columns:
             return dataframe
         
+        texts = dataframe['post'].tolist()
+        langs = [self.detect_language(text) for text in texts]
+        
+        # Group Indian-language posts so each language is translated in one request
+        texts_by_lang = {}
+        for text, lang in zip(texts, langs):
+            if lang in self.indian_languages:
+                texts_by_lang.setdefault(lang, []).append(text)
+        
+        translations = {
+            lang: iter(translated)
+            for lang, translated in self._translate_by_language(texts_by_lang).items()
+        }
+        
         results = []
         
-        for idx, row in dataframe.iterrows():
-            text = row['post']
-            lang = self.detect_language(text)
-            
+        for text, lang in zip(texts, langs):
             analysis = {
                 'original_text': text,
                 'detected_language': lang,
@@ -193,7 +277,9 @@ class BhashiniMultilingualDetector:
             
             if lang in self.indian_languages:
                 # Deep analysis for Indian languages
-                detailed_analysis = self.analyze_regional_text(text, lang)
+                detailed_analysis = self.analyze_regional_text(
+                    text, lang, translated=next(translations[lang])
+                )
                 analysis.update(detailed_analysis)
             else:
                 # Basic analysis for English/other
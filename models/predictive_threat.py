@@ -3,7 +3,6 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split
 import joblib
 import warnings
@@ -17,11 +16,13 @@ class PredictiveThreatIntelligence:
     
     def __init__(self):
         self.model = None
-        self.location_encoder = LabelEncoder()
-        self.threat_level_encoder = LabelEncoder()
+        # Category -> code mappings learned at train time, frozen for prediction
+        self._loc_map = None
+        self._threat_level_map = None
         self.prediction_history = []
+        self._rng = np.random.default_rng(42)
         
-    def prepare_features(self, historical_data):
+    def prepare_features(self, historical_data, fit=False):
         """Prepare features for predictive model"""
         df = historical_data.copy()
         
@@ -36,17 +37,30 @@ class PredictiveThreatIntelligence:
         
         # Location encoding
         if 'location' in df.columns:
-            df['location_encoded'] = self.location_encoder.fit_transform(df['location'])
+            if fit or self._loc_map is None:
+                self._loc_map = self._fit_mapping(df['location'])
+            df['location_encoded'] = self._encode(df['location'], self._loc_map)
         
         # Threat level encoding
         if 'Threat Level' in df.columns:
-            df['threat_level_encoded'] = self.threat_level_encoder.fit_transform(df['Threat Level'])
+            if fit or self._threat_level_map is None:
+                self._threat_level_map = self._fit_mapping(df['Threat Level'])
+            df['threat_level_encoded'] = self._encode(df['Threat Level'], self._threat_level_map)
         
         # Historical patterns
         df = self._add_historical_patterns(df)
         
         return df
     
+    def _fit_mapping(self, values):
+        """Learn a category -> code mapping (same codes LabelEncoder would give)"""
+        categories = values.astype('category').cat.categories
+        return {category: code for code, category in enumerate(categories)}
+    
+    def _encode(self, values, mapping):
+        """Encode values with a frozen mapping; unseen categories become -1"""
+        return values.map(mapping).fillna(-1).astype(np.int32)
+    
     def _calculate_time_gaps(self, df):
         """Calculate time since last attack in each location"""
         df_sorted = df.sort_values('timestamp')
@@ -69,17 +83,14 @@ class PredictiveThreatIntelligence:
     
     def _add_historical_patterns(self, df):
         """Add historical attack patterns"""
-        # Location attack frequency
-        location_counts = df['location'].value_counts().to_dict()
-        df['location_frequency'] = df['location'].map(location_counts)
+        # Location attack frequency (missing locations stay NaN)
+        df['location_frequency'] = df.groupby('location')['location'].transform('size')
         
-        # Day of week patterns
-        day_patterns = df.groupby('day_of_week').size().to_dict()
-        df['day_pattern'] = df['day_of_week'].map(day_patterns)
+        # Day of week patterns (NaT timestamps stay NaN, so no integer cast)
+        df['day_pattern'] = df.groupby('day_of_week')['day_of_week'].transform('size')
         
         # Hourly patterns
-        hour_patterns = df.groupby('hour').size().to_dict()
-        df['hour_pattern'] = df['hour'].map(hour_patterns)
+        df['hour_pattern'] = df.groupby('hour')['hour'].transform('size')
         
         return df
     
@@ -88,21 +99,21 @@ class PredictiveThreatIntelligence:
         print("🔄 Training predictive threat model...")
         
         # Prepare data
-        df = self.prepare_features(historical_data)
+        df = self.prepare_features(historical_data, fit=True)
         
         # Create target: Will there be a high-threat attack in next 24 hours?
-        df['target'] = 0
-        
-        # Mark locations that will have high threat in next 24 hours
         df_sorted = df.sort_values('timestamp')
-        for i in range(len(df_sorted) - 1):
-            current_row = df_sorted.iloc[i]
-            next_row = df_sorted.iloc[i + 1]
-            
-            time_diff = (next_row['timestamp'] - current_row['timestamp']).total_seconds() / 3600
-            
-            if time_diff <= 24 and next_row.get('Threat Level') == 'HIGH':
-                df_sorted.iloc[i, df_sorted.columns.get_loc('target')] = 1
+        
+        # Mark rows whose next event is a high threat within 24 hours
+        time_diff = (df_sorted['timestamp'].shift(-1) - df_sorted['timestamp']).dt.total_seconds() / 3600
+        if 'Threat Level' in df_sorted.columns:
+            next_is_high = df_sorted['Threat Level'].shift(-1).eq('HIGH')
+        else:
+            next_is_high = False
+        
+        target = np.zeros(len(df_sorted), dtype=np.int8)
+        target[((time_diff <= 24) & next_is_high).to_numpy()] = 1
+        df_sorted['target'] = target
         
         # Feature columns
         feature_cols = [
@@ -166,12 +177,15 @@ class PredictiveThreatIntelligence:
         
         predictions = []
         
-        for _, row in latest_by_location.iterrows():
+        # Draw every location's prediction offset in one call
+        hours_offsets = self._rng.integers(1, hours_ahead, size=len(latest_by_location))
+        
+        for (_, row), hours_offset in zip(latest_by_location.iterrows(), hours_offsets):
             # Create feature vector
             features = {}
             
             # Current time features (future prediction)
-            future_time = datetime.now() + timedelta(hours=np.random.randint(1, hours_ahead))
+            future_time = datetime.now() + timedelta(hours=int(hours_offset))
             
             features['hour'] = future_time.hour
             features['day_of_week'] = future_time.weekday()
@@ -240,7 +254,7 @@ class PredictiveThreatIntelligence:
         }
         
         threat_level = 'HIGH' if probability > 0.85 else 'MEDIUM'
-        action = np.random.choice(actions[threat_level])
+        action = self._rng.choice(actions[threat_level])
         
         return f"{action} in {location}"
     
@@ -1,19 +1,20 @@
-from sentence_transformers import SentenceTransformer
 import numpy as np
-
-model = SentenceTransformer("all-MiniLM-L6-v2")
+import pandas as pd
 
 THREAT_KEYWORDS = [
     "fraud", "illegal", "exposed", "lies", "fake", "traitor", "scam"
 ]
 
-def detect_threat(text):
-    text_lower = text.lower()
+def _keyword_score(text_lower):
+    """Number of threat keywords present in already-lowercased text"""
     score = 0
-
     for word in THREAT_KEYWORDS:
         if word in text_lower:
             score += 1
+    return score
+
+def detect_threat(text):
+    score = _keyword_score(text.lower())
 
     confidence = min(score / len(THREAT_KEYWORDS), 1.0)
 
@@ -21,3 +22,18 @@ def detect_threat(text):
         "is_threat": score > 0,
         "confidence": round(confidence, 2)
     }
+
+def detect_threats_batch(texts):
+    """detect_threat over a Series of texts; missing texts score 0"""
+    texts = pd.Series(texts)
+    score = np.fromiter(
+        (_keyword_score(text.lower()) if isinstance(text, str) else 0 for text in texts),
+        dtype=np.int64, count=len(texts)
+    )
+
+    confidence = np.minimum(score / len(THREAT_KEYWORDS), 1.0)
+
+    return pd.DataFrame({
+        "is_threat": score > 0,
+        "confidence": confidence.round(2)
+    }, index=texts.index)
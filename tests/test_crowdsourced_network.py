@@ -0,0 +1,39 @@
+import unittest
+
+from utils.crowdsourced_network import CrowdsourcedVigilantNetwork
+
+
+def _submit(network, **fields):
+    report = {'description': 'suspicious activity', 'ip_address': '10.0.0.1'}
+    report.update(fields)
+    return network.submit_anonymous_report(report)['report_id']
+
+
+class BatchRecomputeTest(unittest.TestCase):
+    def test_rescores_the_networks_own_frame(self):
+        known = [('Delhi', 'TERRORISM'), ('Pune', 'MISINFORMATION'), ('Kashmir', 'CYBER_ATTACK')]
+        for submissions in (known, known + [('Goa', 'UNLISTED_THREAT')]):
+            with self.subTest(submissions=submissions):
+                network = CrowdsourcedVigilantNetwork()
+                for location, threat_type in submissions:
+                    _submit(network, location=location, threat_type=threat_type)
+
+                frame = network.reports_frame()
+                rescored = network.batch_recompute(frame)
+
+                self.assertEqual(rescored['priority'].tolist(), frame['priority'].astype(object).tolist())
+
+    def test_rescoring_keeps_the_evidence_boost(self):
+        network = CrowdsourcedVigilantNetwork()
+        _submit(network, location='Goa', threat_type='UNLISTED_THREAT', evidence_attached=True)
+        _submit(network, location='Goa', threat_type='UNLISTED_THREAT')
+
+        frame = network.reports_frame()
+        rescored = network.batch_recompute(frame)
+
+        self.assertEqual(frame['evidence_attached'].tolist(), [True, False])
+        self.assertEqual(rescored['priority'].tolist(), frame['priority'].astype(object).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
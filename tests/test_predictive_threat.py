@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from models.predictive_threat import PredictiveThreatIntelligence
+
+
+class PrepareFeaturesTest(unittest.TestCase):
+    def test_nat_timestamp_keeps_pattern_features(self):
+        data = pd.DataFrame({
+            "timestamp": pd.to_datetime([
+                "2024-01-01 09:00",  # Monday
+                "2024-01-01 14:00",  # Monday
+                "2024-01-02 09:00",  # Tuesday
+                None,
+                "2024-01-08 09:00",  # Monday
+            ]),
+            "location": ["Delhi", "Mumbai", "Delhi", "Delhi", "Chennai"],
+            "Threat Level": ["LOW", "HIGH", "MEDIUM", "LOW", "HIGH"],
+        })
+
+        features = PredictiveThreatIntelligence().prepare_features(data, fit=True)
+
+        np.testing.assert_array_equal(features["location_frequency"], [3, 1, 3, 3, 1])
+        np.testing.assert_array_equal(features["day_pattern"], [3, 3, 1, np.nan, 3])
+        np.testing.assert_array_equal(features["hour_pattern"], [3, 1, 3, np.nan, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
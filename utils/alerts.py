@@ -1,65 +1,98 @@
 from datetime import datetime
+from collections import Counter, deque
+from dataclasses import dataclass, field
 import json
+import time
+
+ALERT_LEVELS = {
+    'LOW': {'color': '#10b981', 'icon': 'ℹ️'},
+    'MEDIUM': {'color': '#f59e0b', 'icon': '⚠️'},
+    'HIGH': {'color': '#ef4444', 'icon': '🚨'},
+    'CRITICAL': {'color': '#dc2626', 'icon': '🔥'}
+}
+
+@dataclass(slots=True)
+class Alert:
+    """A single alert; the display timestamp is formatted on read"""
+    id: int
+    type: str
+    message: str
+    severity: str
+    details: dict = field(default_factory=dict)
+    acknowledged: bool = False
+    active: bool = True
+    created_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self):
+        return datetime.fromtimestamp(self.created_ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+    
+    def to_dict(self):
+        """Dict form of the alert for dict-based consumers"""
+        return {
+            'id': self.id,
+            'timestamp': self.timestamp,
+            'type': self.type,
+            'message': self.message,
+            'severity': self.severity,
+            'details': self.details,
+            'acknowledged': self.acknowledged,
+            'active': self.active
+        }
 
 class AlertSystem:
     def __init__(self):
-        self.alerts = []
-        self.alert_levels = {
-            'LOW': {'color': '#10b981', 'icon': 'ℹ️'},
-            'MEDIUM': {'color': '#f59e0b', 'icon': '⚠️'},
-            'HIGH': {'color': '#ef4444', 'icon': '🚨'},
-            'CRITICAL': {'color': '#dc2626', 'icon': '🔥'}
-        }
+        # Keep only last 100 alerts
+        self.alerts = deque(maxlen=100)
+        self._by_id = {}
+        self._active_counts = Counter()
+        self._next_id = 1
+        self.alert_levels = ALERT_LEVELS
     
     def generate_alert(self, alert_type, message, severity, details=None):
         """Generate a new alert"""
-        alert = {
-            'id': len(self.alerts) + 1,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'type': alert_type,
-            'message': message,
-            'severity': severity,
-            'details': details or {},
-            'acknowledged': False,
-            'active': True
-        }
+        alert = Alert(self._next_id, alert_type, message, severity, details or {})
         
-        self.alerts.append(alert)
+        self._next_id += 1
         
-        # Keep only last 100 alerts
-        if len(self.alerts) > 100:
-            self.alerts = self.alerts[-100:]
+        # Evict the oldest alert from the index before the deque drops it
+        if len(self.alerts) == self.alerts.maxlen:
+            evicted = self.alerts[0]
+            del self._by_id[evicted.id]
+            if evicted.active:
+                self._active_counts[evicted.severity] -= 1
+        
+        self.alerts.append(alert)
+        self._by_id[alert.id] = alert
+        self._active_counts[severity] += 1
         
         return alert
     
     def get_active_alerts(self, severity=None):
         """Get active alerts, optionally filtered by severity"""
         if severity:
-            return [a for a in self.alerts if a['active'] and a['severity'] == severity]
-        return [a for a in self.alerts if a['active']]
+            return [a for a in self.alerts if a.active and a.severity == severity]
+        return [a for a in self.alerts if a.active]
     
     def acknowledge_alert(self, alert_id):
         """Mark alert as acknowledged"""
-        for alert in self.alerts:
-            if alert['id'] == alert_id:
-                alert['acknowledged'] = True
-                alert['active'] = False
-                break
+        alert = self._by_id.get(alert_id)
+        if alert and alert.active:
+            alert.acknowledged = True
+            alert.active = False
+            self._active_counts[alert.severity] -= 1
     
     def get_alert_summary(self):
         """Get alert summary statistics"""
         summary = {
             'total': len(self.alerts),
-            'active': len(self.get_active_alerts()),
-            'by_severity': {},
+            'active': sum(self._active_counts.values()),
+            'by_severity': {
+                level: self._active_counts[level] for level in self.alert_levels
+            },
             'by_type': {}
         }
         
-        for level in self.alert_levels:
-            summary['by_severity'][level] = len(
-                [a for a in self.alerts if a['severity'] == level and a['active']]
-            )
-        
         return summary
 
 # Alert templates
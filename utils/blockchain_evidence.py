@@ -1,10 +1,48 @@
 # utils/blockchain_evidence.py
 import hashlib
-import json
 import datetime
+import logging
+import orjson
+import numpy as np
 import pandas as pd
+from array import array
+from collections import Counter, defaultdict
 from typing import Dict, List, Optional
 import base64
+import functools
+
+logger = logging.getLogger(__name__)
+
+# hashlib's SHA-256 is OpenSSL's, which already picks SHA-NI/AVX2 code at runtime
+_sha256 = hashlib.sha256
+
+def _sha256_hex(data: bytes) -> str:
+    """SHA-256 hex digest of raw bytes"""
+    return _sha256(data).hexdigest()
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    """Parent of two 32-byte Merkle nodes"""
+    # Always one 64-byte data block followed by the same constant padding block
+    return _sha256(left + right).digest()
+
+@functools.lru_cache(maxsize=1024)
+def _case_id_tag(case_id: str) -> str:
+    """Short stable tag for a case id, memoized across repeated exports"""
+    return _sha256_hex(case_id.encode())[:16]
+
+# Fixed keys and punctuation of a block's compact JSON encoding; the two
+# placeholder zeros stand in for the evidence and index values
+_BLOCK_ENVELOPE_BYTES = len(orjson.dumps(
+    {'index': 0, 'timestamp': '', 'evidence': 0, 'previous_hash': '', 'hash': ''}
+)) - 2
+
+def _merkle_level(nodes: List[bytes]) -> List[bytes]:
+    """Hash a whole Merkle level's sibling pairs into the level above"""
+    if len(nodes) % 2:
+        nodes = nodes + [nodes[-1]]
+    # zip over one iterator pairs neighbours without copying two slices
+    pairs = iter(nodes)
+    return [_merkle_node(left, right) for left, right in zip(pairs, pairs)]
 
 class BlockchainEvidenceLedger:
     """
@@ -15,31 +53,74 @@ class BlockchainEvidenceLedger:
     def __init__(self, chain_name="SENTINEL-X_EVIDENCE_CHAIN"):
         self.chain = []
         self.chain_name = chain_name
+        # Merkle tree over block hashes: level 0 holds the leaves, the last level the root
+        self.merkle_levels: List[List[bytes]] = []
+        # case_id -> indices of the blocks holding that case's evidence
+        self._by_case = defaultdict(list)
+        # Interned case code per block, for set-of-cases selection in one vectorized pass
+        self._case_code_map: Dict[str, int] = {}
+        self._case_codes = array('I')
+        # Column mirrors of the linkage fields, 32 raw bytes per hash, for vectorized checks
+        self._hash_col = bytearray()
+        self._prev_hash_col = bytearray()
+        self._index_col = array('q')
+        # Running size of the blocks' compact JSON encoding, for the storage estimate
+        self._approx_bytes = 0
         self.initialize_genesis_block()
         
     def initialize_genesis_block(self):
         """Create the first block in the chain (genesis block)"""
+        timestamp = datetime.datetime.now().isoformat()
+        evidence = {
+            'description': 'Genesis Block - SENTINEL-X Evidence Chain Initialization',
+            'case_id': 'GENESIS-2024-001',
+            'agency': 'National Cyber Security Coordinator',
+            'purpose': 'Initialize tamper-proof evidence ledger'
+        }
+        canonical_evidence = self._canonical_json(evidence)
+        digest = self._calculate_digest(0, timestamp, canonical_evidence, '0' * 64)
         genesis_block = {
             'index': 0,
-            'timestamp': datetime.datetime.now().isoformat(),
-            'evidence': {
-                'description': 'Genesis Block - SENTINEL-X Evidence Chain Initialization',
-                'case_id': 'GENESIS-2024-001',
-                'agency': 'National Cyber Security Coordinator',
-                'purpose': 'Initialize tamper-proof evidence ledger'
-            },
+            'timestamp': timestamp,
+            'evidence': evidence,
             'previous_hash': '0' * 64,
-            'hash': self.calculate_hash(0, datetime.datetime.now().isoformat(), {}, '0' * 64)
+            'hash': digest.hex()
         }
         self.chain.append(genesis_block)
+        self._append_merkle_leaf(digest)
+        self._mirror_block(genesis_block, digest)
+        self._approx_bytes += self._encoded_size(genesis_block, canonical_evidence)
+        self._index_case(genesis_block['evidence']['case_id'], 0)
+    
+    def calculate_hash(self, index: int, timestamp: str, canonical_evidence: bytes, previous_hash: str) -> str:
+        """Calculate SHA-256 hash for a block from its canonical evidence bytes"""
+        return self._calculate_digest(index, timestamp, canonical_evidence, previous_hash).hex()
     
-    def calculate_hash(self, index: int, timestamp: str, evidence: Dict, previous_hash: str) -> str:
-        """Calculate SHA-256 hash for a block"""
-        block_string = f"{index}{timestamp}{json.dumps(evidence, sort_keys=True)}{previous_hash}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+    def _calculate_digest(self, index: int, timestamp: str, canonical_evidence: bytes, previous_hash: str) -> bytes:
+        """Raw 32-byte block digest; the preimage still commits to the hex previous hash"""
+        # Feed the parts straight into the hash instead of concatenating one big buffer
+        h = _sha256(f"{index}{timestamp}".encode())
+        h.update(canonical_evidence)
+        h.update(previous_hash.encode())
+        return h.digest()
+    
+    def _canonical_json(self, data: Dict) -> bytes:
+        """Canonical (key-sorted) JSON encoding used for hashing"""
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    
+    def _encoded_size(self, block: Dict, canonical_evidence: bytes) -> int:
+        """Byte length of a block's compact JSON encoding, from its already-encoded evidence"""
+        return (_BLOCK_ENVELOPE_BYTES + len(canonical_evidence) + len(str(block['index']))
+                + len(block['timestamp']) + len(block['previous_hash']) + len(block['hash']))
+    
+    def _public_block(self, block: Dict) -> Dict:
+        """Copy of a block without internal fields, for returning and export"""
+        return {key: value for key, value in block.items() if not key.startswith('_')}
     
     def add_evidence(self, evidence_data: Dict, case_id: str, agency: str) -> Dict:
         """Add new evidence to the blockchain"""
+        content_hash = self._hash_evidence_content(evidence_data)
+        
         # Create evidence metadata
         evidence_metadata = {
             'case_id': case_id,
@@ -49,10 +130,10 @@ class BlockchainEvidenceLedger:
             'severity': evidence_data.get('threat_level', 'UNKNOWN'),
             'location': evidence_data.get('location', 'Unknown'),
             'description': evidence_data.get('description', ''),
-            'digital_signature': self._create_digital_signature(evidence_data),
+            'digital_signature': self._create_digital_signature(content_hash),
             'witnesses': evidence_data.get('witnesses', []),
             'collecting_officer': evidence_data.get('collecting_officer', 'SENTINEL-X AI System'),
-            'hash_evidence': self._hash_evidence_content(evidence_data)
+            'hash_evidence': content_hash
         }
         
         # Add supporting files/metadata
@@ -70,7 +151,10 @@ class BlockchainEvidenceLedger:
         previous_block = self.chain[-1]
         new_index = previous_block['index'] + 1
         new_timestamp = datetime.datetime.now().isoformat()
-        new_hash = self.calculate_hash(new_index, new_timestamp, evidence_metadata, previous_block['hash'])
+        # Serialize once for the block hash and the storage estimate
+        canonical_evidence = self._canonical_json(evidence_metadata)
+        digest = self._calculate_digest(new_index, new_timestamp, canonical_evidence, previous_block['hash'])
+        new_hash = digest.hex()
         
         new_block = {
             'index': new_index,
@@ -83,8 +167,13 @@ class BlockchainEvidenceLedger:
         # Verify block before adding
         if self.verify_block(new_block, previous_block):
             self.chain.append(new_block)
-            print(f"✅ Evidence added to blockchain. Block #{new_index} | Hash: {new_hash[:16]}...")
-            return new_block
+            self._append_merkle_leaf(digest)
+            self._mirror_block(new_block, digest)
+            self._approx_bytes += self._encoded_size(new_block, canonical_evidence)
+            self._index_case(case_id, new_index)
+            logger.info("Evidence added: block=%d hash=%.16s", new_index, new_hash)
+            # A copy, so callers cannot edit the ledger through the returned block
+            return self._public_block(new_block)
         else:
             raise ValueError("Block verification failed!")
     
@@ -99,17 +188,7 @@ class BlockchainEvidenceLedger:
             return False
         
         # Recalculate hash
-        calculated_hash = self.calculate_hash(
-            block['index'],
-            block['timestamp'],
-            block['evidence'],
-            block['previous_hash']
-        )
-        
-        if block['hash'] != calculated_hash:
-            return False
-        
-        return True
+        return self._recompute_hash(block, bytes.fromhex(block['hash']))
     
     def verify_chain(self) -> Dict:
         """Verify the entire blockchain integrity"""
@@ -119,28 +198,160 @@ class BlockchainEvidenceLedger:
         if len(self.chain) == 1:
             return {'status': 'VALID', 'message': 'Only genesis block exists'}
         
-        for i in range(1, len(self.chain)):
-            if not self.verify_block(self.chain[i], self.chain[i-1]):
-                return {
-                    'status': 'COMPROMISED',
-                    'message': f'Chain compromised at block #{i}',
-                    'compromised_block': i
-                }
+        # Link check: the mirrors were recorded as each block was verified and appended,
+        # so one vectorized compare against them finds any edited index or hash field.
+        # Edits to the evidence and timestamp are caught by the hash pass
+        n = min(len(self.chain), len(self._index_col))
+        blocks = self.chain[:n]
+        broken = (
+            (np.array([block['index'] for block in blocks], dtype=object)
+             != np.array(self._index_col[:n], dtype=object))
+            | (np.array([block['previous_hash'] for block in blocks])
+               != np.array(self._hex_column(self._prev_hash_col)[:n]))
+            | (np.array([block['hash'] for block in blocks])
+               != np.array(self._hex_column(self._hash_col)[:n]))
+        ).astype(bool)
+        if broken.any():
+            # Fail fast: a broken link needs no hashing to report
+            compromised = int(np.argmax(broken))
+            return {
+                'status': 'COMPROMISED',
+                'message': f'Chain compromised at block #{compromised}',
+                'compromised_block': compromised
+            }
+        
+        # Hash recompute: only reached with clean links, i.e. a forged hash or edited contents
+        compromised = self._first_bad_hash(1, len(self.chain))
+        if compromised is not None:
+            return {
+                'status': 'COMPROMISED',
+                'message': f'Chain compromised at block #{compromised}',
+                'compromised_block': compromised
+            }
+        
+        # Recompute the Merkle root from the stored block hashes; this also catches
+        # a chain that was rewritten consistently after the tree recorded it
+        leaves = [self._merkle_leaf(bytes.fromhex(block['hash'])) for block in self.chain]
+        if self._merkle_root_from_leaves(leaves) != self.merkle_levels[-1][0]:
+            # With every shared leaf intact the chain was truncated or extended,
+            # so the first block missing from one side is the one to report
+            mismatch = next(
+                (i for i, (leaf, recorded) in enumerate(zip(leaves, self.merkle_levels[0]))
+                 if leaf != recorded),
+                min(len(leaves), len(self.merkle_levels[0]))
+            )
+            return {
+                'status': 'COMPROMISED',
+                'message': f'Merkle root mismatch at block #{mismatch}',
+                'compromised_block': mismatch
+            }
         
         return {
             'status': 'VALID',
             'message': f'Blockchain integrity verified for {len(self.chain)} blocks',
-            'total_blocks': len(self.chain)
+            'total_blocks': len(self.chain),
+            'merkle_root': self.merkle_root()
         }
     
-    def _create_digital_signature(self, evidence_data: Dict) -> Dict:
-        """Create digital signature for evidence"""
-        # In production, this would use actual digital signatures
-        evidence_string = json.dumps(evidence_data, sort_keys=True)
+    def _mirror_block(self, block: Dict, digest: bytes):
+        """Append a block's linkage fields to the column mirrors"""
+        self._hash_col += digest
+        self._prev_hash_col += bytes.fromhex(block['previous_hash'])
+        self._index_col.append(block['index'])
+    
+    @staticmethod
+    def _hex_column(column: bytearray) -> List[str]:
+        """Hex strings of the 32-byte hashes in a hash column"""
+        hexed = column.hex()
+        return [hexed[i:i + 64] for i in range(0, len(hexed), 64)]
+    
+    def _recompute_hash(self, block: Dict, digest: bytes) -> bool:
+        """Check a block's recorded digest against its contents"""
+        # Re-encode the live evidence dict: it is what the exports read, so an
+        # edit to it must show up here
+        return digest == self._calculate_digest(
+            block['index'],
+            block['timestamp'],
+            self._canonical_json(block['evidence']),
+            block['previous_hash']
+        )
+    
+    def _first_bad_hash(self, start: int, stop: int) -> Optional[int]:
+        """Index of the first block in chain[start:stop] whose hash does not match"""
+        return next(
+            (i for i in range(start, stop)
+             if not self._recompute_hash(self.chain[i], bytes(self._hash_col[32 * i:32 * i + 32]))),
+            None
+        )
+    
+    def _merkle_leaf(self, block_digest: bytes) -> bytes:
+        """Merkle leaf for a raw block digest"""
+        return _sha256(block_digest).digest()
+    
+    def _append_merkle_leaf(self, block_digest: bytes):
+        """Add a block as a Merkle leaf, updating only the right edge of the tree"""
+        levels = self.merkle_levels
+        if not levels:
+            levels.append([])
+        levels[0].append(self._merkle_leaf(block_digest))
         
+        # Recompute the rightmost parent on every level; an odd last node pairs with itself
+        level = 0
+        while len(levels[level]) > 1:
+            nodes = levels[level]
+            parent_index = (len(nodes) - 1) // 2
+            left = nodes[2 * parent_index]
+            right = nodes[2 * parent_index + 1] if 2 * parent_index + 1 < len(nodes) else left
+            parent = _merkle_node(left, right)
+            
+            if level + 1 == len(levels):
+                levels.append([])
+            parents = levels[level + 1]
+            if parent_index < len(parents):
+                parents[parent_index] = parent
+            else:
+                parents.append(parent)
+            level += 1
+    
+    def _merkle_root_from_leaves(self, leaves: List[bytes]) -> bytes:
+        """Collapse a list of leaves into the Merkle root"""
+        level = leaves
+        while len(level) > 1:
+            level = _merkle_level(level)
+        return level[0]
+    
+    def merkle_root(self) -> str:
+        """Current Merkle root over all blocks"""
+        return self.merkle_levels[-1][0].hex()
+    
+    def inclusion_proof(self, index: int) -> List[Dict]:
+        """Sibling hashes proving block #index is included under the Merkle root"""
+        path = []
+        for nodes in self.merkle_levels[:-1]:
+            sibling = index ^ 1
+            sibling_hash = nodes[sibling] if sibling < len(nodes) else nodes[index]
+            path.append({
+                'hash': sibling_hash.hex(),
+                'position': 'left' if sibling < index else 'right'
+            })
+            index //= 2
+        return path
+    
+    @staticmethod
+    def verify_inclusion(block_hash: str, proof: List[Dict], merkle_root: str) -> bool:
+        """Check a block hash against an inclusion proof in O(log N) hashes"""
+        node = _sha256(bytes.fromhex(block_hash)).digest()
+        for step in proof:
+            sibling = bytes.fromhex(step['hash'])
+            node = _merkle_node(sibling, node) if step['position'] == 'left' else _merkle_node(node, sibling)
+        return node.hex() == merkle_root
+    
+    def _create_digital_signature(self, content_hash: str) -> Dict:
+        """Create digital signature over the evidence content hash"""
+        # In production, this would use actual digital signatures
         return {
             'signature_method': 'SHA256-RSA (Simulated)',
-            'signature': hashlib.sha256(evidence_string.encode()).hexdigest(),
+            'signature': content_hash,
             'signing_authority': 'SENTINEL-X Digital Evidence System',
             'timestamp_signed': datetime.datetime.now().isoformat(),
             'public_key': 'MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA' + '...'  # Truncated
@@ -155,21 +366,53 @@ class BlockchainEvidenceLedger:
             'source': evidence_data.get('source', '')
         }
         
-        return hashlib.sha256(json.dumps(content_to_hash, sort_keys=True).encode()).hexdigest()
+        return _sha256_hex(self._canonical_json(content_to_hash))
     
     def _hash_file(self, content: str) -> str:
         """Hash file content"""
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _sha256_hex(content.encode())
+    
+    def _index_case(self, case_id: str, index: int):
+        """Record block #index under its case"""
+        self._by_case[case_id].append(index)
+        self._case_codes.append(self._case_code_map.setdefault(case_id, len(self._case_code_map)))
+    
+    def _case_evidence(self, case_id: str) -> List[Dict]:
+        """Blocks recorded for a case, in chain order"""
+        return [self.chain[index] for index in self._by_case.get(case_id, [])]
+    
+    def get_evidence_for_cases(self, case_ids: List[str]) -> List[Dict]:
+        """Blocks recorded for any of the given cases, in chain order"""
+        codes = [self._case_code_map[case_id] for case_id in case_ids if case_id in self._case_code_map]
+        if not codes:
+            return []
+        
+        case_codes = np.array(self._case_codes, dtype=np.uint32)
+        return [self.chain[index] for index in np.flatnonzero(np.isin(case_codes, codes))]
     
     def generate_fir_report(self, case_id: str) -> Dict:
         """Generate FIR-ready report for law enforcement"""
         # Find all evidence for this case
-        case_evidence = [block for block in self.chain 
-                        if block['evidence'].get('case_id') == case_id]
+        case_evidence = self._case_evidence(case_id)
         
         if not case_evidence:
             return {'error': f'No evidence found for case {case_id}'}
         
+        # One pass over the case's blocks for both per-block lists
+        evidence_chain = []
+        digital_signatures = []
+        for block in case_evidence:
+            evidence = block['evidence']
+            evidence_chain.append({
+                'block_index': block['index'],
+                'timestamp': block['timestamp'],
+                'evidence_hash': block['hash'],
+                'evidence_type': evidence['evidence_type'],
+                'severity': evidence['severity'],
+                'description': evidence['description']
+            })
+            digital_signatures.append(evidence['digital_signature'])
+        
         # Create FIR report
         fir_report = {
             'fir_number': f'FIR/{datetime.datetime.now().strftime("%Y")}/{case_id}',
@@ -192,21 +435,8 @@ class BlockchainEvidenceLedger:
                 'date_time_occurrence': case_evidence[0]['evidence']['timestamp_collected'],
                 'place_of_occurrence': case_evidence[0]['evidence'].get('location', 'Multiple locations')
             },
-            'evidence_chain': [
-                {
-                    'block_index': block['index'],
-                    'timestamp': block['timestamp'],
-                    'evidence_hash': block['hash'],
-                    'evidence_type': block['evidence']['evidence_type'],
-                    'severity': block['evidence']['severity'],
-                    'description': block['evidence']['description']
-                }
-                for block in case_evidence
-            ],
-            'digital_signatures': [
-                block['evidence']['digital_signature']
-                for block in case_evidence
-            ],
+            'evidence_chain': evidence_chain,
+            'digital_signatures': digital_signatures,
             'blockchain_verification': self.verify_chain(),
             'investigation_officer': {
                 'name': 'Sh. Rajesh Kumar, IPS',
@@ -233,12 +463,39 @@ class BlockchainEvidenceLedger:
     
     def generate_ecourt_compatible(self, case_id: str) -> Dict:
         """Generate e-Court compatible evidence package"""
-        case_evidence = [block for block in self.chain 
-                        if block['evidence'].get('case_id') == case_id]
+        case_evidence = self._case_evidence(case_id)
         
         if not case_evidence:
             return {'error': f'No evidence found for case {case_id}'}
         
+        merkle_root = self.merkle_root()
+        
+        # One pass over the case's blocks for both per-block lists
+        evidence_files = []
+        witness_statements = []
+        for idx, block in enumerate(case_evidence):
+            evidence_files.append({
+                'file_name': f'evidence_block_{block["index"]}.json',
+                'content_type': 'application/json',
+                'hash_value': block['hash'],
+                'blockchain_proof': {
+                    'previous_hash': block['previous_hash'],
+                    'timestamp': block['timestamp'],
+                    'index': block['index'],
+                    'merkle_proof': {
+                        'leaf': block['hash'],
+                        'path': self.inclusion_proof(block['index']),
+                        'root': merkle_root
+                    }
+                }
+            })
+            witness_statements.append({
+                'witness_id': f'WIT{idx:03d}',
+                'name': 'SENTINEL-X AI System',
+                'affidavit': 'I hereby certify that the attached digital evidence has been collected, preserved, and presented in its original form without any tampering or modification.',
+                'digital_signature': block['evidence']['digital_signature']
+            })
+        
         # Create e-Court package
         ecourt_package = {
             'package_id': f'ECOURT/{datetime.datetime.now().strftime("%Y%m%d")}/{case_id}',
@@ -255,34 +512,15 @@ class BlockchainEvidenceLedger:
                 'threat_assessment': 'HIGH RISK TO NATIONAL SECURITY'
             },
             'blockchain_certificate': {
-                'certificate_id': f'BC-CERT-{hashlib.sha256(case_id.encode()).hexdigest()[:16]}',
+                'certificate_id': f'BC-CERT-{_case_id_tag(case_id)}',
                 'issuing_authority': 'National Forensic Sciences University',
                 'validity_period': 'PERMANENT',
                 'verification_url': 'https://verify.sentinel-x.gov.in/blockchain',
-                'qr_code_data': f"VERIFY|{case_id}|{self.chain[-1]['hash']}"
+                'qr_code_data': f"VERIFY|{case_id}|{self.chain[-1]['hash']}",
+                'merkle_root': merkle_root
             },
-            'digital_evidence_files': [
-                {
-                    'file_name': f'evidence_block_{block["index"]}.json',
-                    'content_type': 'application/json',
-                    'hash_value': block['hash'],
-                    'blockchain_proof': {
-                        'previous_hash': block['previous_hash'],
-                        'timestamp': block['timestamp'],
-                        'index': block['index']
-                    }
-                }
-                for block in case_evidence
-            ],
-            'witness_statements': [
-                {
-                    'witness_id': f'WIT{idx:03d}',
-                    'name': 'SENTINEL-X AI System',
-                    'affidavit': 'I hereby certify that the attached digital evidence has been collected, preserved, and presented in its original form without any tampering or modification.',
-                    'digital_signature': block['evidence']['digital_signature']
-                }
-                for idx, block in enumerate(case_evidence)
-            ],
+            'digital_evidence_files': evidence_files,
+            'witness_statements': witness_statements,
             'compliance_certificates': {
                 'it_act_compliance': 'Compliant with IT Act 2000 & 2008 Amendments',
                 'evidence_act_compliance': 'Compliant with Indian Evidence Act 1872 Section 65B',
@@ -310,18 +548,23 @@ class BlockchainEvidenceLedger:
     
     def get_chain_statistics(self) -> Dict:
         """Get blockchain statistics"""
+        case_ids = set()
+        evidence_types = Counter()
+        
+        # One pass over the chain for all per-block aggregates
+        for block in self.chain:
+            evidence = block['evidence']
+            case_ids.add(evidence.get('case_id'))
+            evidence_types[evidence.get('evidence_type')] += 1
+        
         return {
             'total_blocks': len(self.chain),
             'first_block_timestamp': self.chain[0]['timestamp'] if self.chain else 'N/A',
             'last_block_timestamp': self.chain[-1]['timestamp'] if self.chain else 'N/A',
-            'total_cases': len(set(block['evidence'].get('case_id') for block in self.chain)),
-            'evidence_types': {
-                ev_type: sum(1 for block in self.chain 
-                            if block['evidence'].get('evidence_type') == ev_type)
-                for ev_type in set(block['evidence'].get('evidence_type') for block in self.chain)
-            },
+            'total_cases': len(case_ids),
+            'evidence_types': dict(evidence_types),
             'chain_integrity': self.verify_chain()['status'],
-            'storage_size_estimate': f"{len(json.dumps(self.chain)) / 1024:.2f} KB"
+            'storage_size_estimate': f"{self._approx_bytes / 1024:.2f} KB"
         }
     
     def export_for_court(self, case_id: str, format: str = 'json') -> Dict:
@@ -331,11 +574,10 @@ class BlockchainEvidenceLedger:
         elif format == 'fir':
             return self.generate_fir_report(case_id)
         elif format == 'blockchain':
-            case_evidence = [block for block in self.chain 
-                            if block['evidence'].get('case_id') == case_id]
+            case_evidence = self._case_evidence(case_id)
             return {
                 'case_id': case_id,
-                'blockchain_evidence': case_evidence,
+                'blockchain_evidence': [self._public_block(block) for block in case_evidence],
                 'verification_report': self.verify_chain()
             }
         else:
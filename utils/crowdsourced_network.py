@@ -5,46 +5,133 @@ from datetime import datetime, timedelta
 import streamlit as st
 import hashlib
 import json
+import random
+import secrets
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque
+from heapq import nlargest
+from itertools import islice
 from typing import Dict, List, Optional
 
+# Recent reports kept per location and per threat type for corroboration
+SIMILAR_WINDOW = 100
+
+# Reports kept in memory; older ones are evicted (and archived when an archive path is set)
+MAX_RESIDENT_REPORTS = 10_000
+# Evicted reports are written to the archive in batches of this size
+ARCHIVE_BATCH_SIZE = 500
+
+# Police response status indexed by "responded within the hour"
+_STATUSES = ('IN_PROGRESS', 'RESPONDED')
+
+# Per-report fields mirrored column-wise for analytics
+REPORT_COLUMNS = ('report_id', 'timestamp', 'status', 'priority', 'threat_type', 'location',
+                  'evidence_attached', 'verification_score')
+
+# Priority levels in score order; a score at or above each threshold moves up one level
+PRIORITY_LEVELS = ('LOW', 'MEDIUM', 'HIGH', 'IMMEDIATE')
+_PRIORITY_THRESHOLDS = np.array([30, 50, 70])
+
+def _score_batch(high_risk: np.ndarray, threat_scores: np.ndarray, evidence: np.ndarray,
+                 reward_high_risk: np.ndarray, reward_rates: np.ndarray):
+    """Vectorized _calculate_priority + RewardSystem.calculate_points over whole columns"""
+    score = 30 * high_risk + threat_scores + 20 * evidence
+    priority_codes = np.searchsorted(_PRIORITY_THRESHOLDS, score, side='right')
+    
+    # Same multiplication order as calculate_points, so the float rounding matches
+    points = reward_rates[priority_codes].astype(np.float64)
+    points = np.where(evidence, points * 1.5, points)
+    points = np.where(reward_high_risk, points * 1.3, points)
+    return priority_codes, points.astype(np.int64)
+
 class CrowdsourcedVigilantNetwork:
     """
     Crowdsourced Vigilant Network
     Enables public participation in national security through anonymous reporting
     """
     
-    def __init__(self):
-        self.reports = []
+    _HIGH_RISK_LOCATIONS = frozenset({'Delhi', 'Mumbai', 'Kashmir', 'Punjab', 'Assam'})
+    _THREAT_SCORES = {
+        'TERRORISM': 50,
+        'CYBER_ATTACK': 40,
+        'MISINFORMATION': 30,
+        'SUSPICIOUS_ACTIVITY': 20,
+        'GENERAL_THREAT': 10
+    }
+    _AUTO_VERIFY_CITIES = frozenset({'Delhi', 'Mumbai', 'Chennai', 'Kolkata'})
+    _EVIDENCE_MEDIA = frozenset({'PHOTO', 'VIDEO', 'AUDIO'})
+    
+    def __init__(self, archive_path: Optional[str] = None):
+        # Hot working set in submission order; the oldest report drops out once it is full
+        self.reports = deque(maxlen=MAX_RESIDENT_REPORTS)
+        self._evicted = 0
+        # Evicted reports go here as JSON lines, batched through _archive_buffer
+        self.archive_path = archive_path
+        self._archive_buffer: List[Dict] = []
+        # report_id -> report, for O(1) lookups; self.reports keeps submission order
+        self._reports_by_id: Dict[str, Dict] = {}
+        # Column-wise mirror of the analytics fields; a report's position is report['_row'] - self._evicted
+        self._cols: Dict[str, deque] = {name: deque(maxlen=MAX_RESIDENT_REPORTS) for name in REPORT_COLUMNS}
+        # DataFrame over those columns; None means stale, rebuilt on demand
+        self._reports_df: Optional[pd.DataFrame] = None
+        # Dashboard stats are cached until the next write; _version counts writes
+        self._cached_stats: Optional[Dict] = None
+        self._stats_dirty = True
+        self._version = 0
         self.users = {}
+        # Running tallies for the dashboard, updated on every status change
+        self._status_counts = Counter()
+        self._threat_counts = Counter()
+        # Most recent reports per location / threat type, candidates for _find_similar_reports
+        self._by_location = defaultdict(lambda: deque(maxlen=SIMILAR_WINDOW))
+        self._by_threat = defaultdict(lambda: deque(maxlen=SIMILAR_WINDOW))
         self.rewards_system = RewardSystem()
         self.police_integration = PoliceIntegration()
         
     def submit_anonymous_report(self, report_data: Dict) -> Dict:
         """Submit anonymous threat report from citizen"""
+        # Read the clock once; every timestamp for this submission derives from it
+        now = datetime.now()
+        now_iso = now.isoformat()
+        
         # Generate anonymous user ID
         if 'user_id' not in report_data:
             user_ip = report_data.get('ip_address', '0.0.0.0')
-            timestamp = datetime.now().isoformat()
-            user_id = hashlib.sha256(f"{user_ip}{timestamp}".encode()).hexdigest()[:16]
+            # Only namespacing, not security: an 8-byte BLAKE2b digest is the same 16 hex chars
+            user_id = hashlib.blake2b(f"{user_ip}{now_iso}".encode(), digest_size=8).hexdigest()
             report_data['user_id'] = f"ANON_{user_id}"
         
         # Add metadata
-        report_data['report_id'] = self._generate_report_id()
-        report_data['timestamp'] = datetime.now().isoformat()
+        report_data['report_id'] = self._generate_report_id(now)
+        report_data['timestamp'] = now_iso
+        # Parsed form kept alongside the ISO string so analytics never re-parse it
+        report_data['_ts'] = now
         report_data['status'] = 'PENDING_VERIFICATION'
         report_data['verification_score'] = 0
         report_data['priority'] = self._calculate_priority(report_data)
         
         # Store report
+        if len(self.reports) == MAX_RESIDENT_REPORTS:
+            self._evict_oldest()
+        report_data['_row'] = self._evicted + len(self.reports)
         self.reports.append(report_data)
+        for name in REPORT_COLUMNS:
+            self._cols[name].append(report_data.get(name))
+        self._cols['timestamp'][-1] = report_data['_ts']
+        self._reports_by_id[report_data['report_id']] = report_data
+        self._mark_dirty()
+        self._status_counts['PENDING_VERIFICATION'] += 1
+        self._threat_counts[report_data.get('threat_type', 'UNKNOWN')] += 1
+        self._by_location[report_data.get('location')].append(report_data)
+        self._by_threat[report_data.get('threat_type')].append(report_data)
         
         # Update user statistics
-        self._update_user_stats(report_data['user_id'])
+        self._update_user_stats(report_data['user_id'], now_iso)
         
         # Auto-verify if high confidence
         if self._auto_verify_report(report_data):
-            report_data['status'] = 'VERIFIED'
-            report_data['verification_score'] = 85
+            self._set_status(report_data, 'VERIFIED')
+            self._set_verification_score(report_data, 85)
             self._assign_rewards(report_data['user_id'], report_data)
         
         return {
@@ -55,10 +142,67 @@ class CrowdsourcedVigilantNetwork:
             'reward_eligible': report_data['status'] == 'VERIFIED'
         }
     
-    def _generate_report_id(self) -> str:
+    def _set_status(self, report: Dict, status: str):
+        """Change a report's status, keeping the status tallies in step"""
+        self._status_counts[report['status']] -= 1
+        report['status'] = status
+        self._cols['status'][report['_row'] - self._evicted] = status
+        self._status_counts[status] += 1
+        self._mark_dirty()
+    
+    def _set_verification_score(self, report: Dict, score: int):
+        """Change a report's verification score, keeping its column in step"""
+        report['verification_score'] = score
+        self._cols['verification_score'][report['_row'] - self._evicted] = score
+        self._mark_dirty()
+    
+    def _evict_oldest(self):
+        """Drop the oldest report from the working set, queueing it for the archive"""
+        evicted = self.reports.popleft()
+        for column in self._cols.values():
+            column.popleft()
+        self._reports_by_id.pop(evicted['report_id'], None)
+        self._evicted += 1
+        # The oldest report overall is also the oldest in its per-key indexes
+        for index, key in ((self._by_location, evicted.get('location')),
+                           (self._by_threat, evicted.get('threat_type'))):
+            candidates = index.get(key)
+            if candidates and candidates[0] is evicted:
+                candidates.popleft()
+                if not candidates:
+                    del index[key]
+        
+        if self.archive_path:
+            self._archive_buffer.append(evicted)
+            if len(self._archive_buffer) >= ARCHIVE_BATCH_SIZE:
+                self.flush_archive()
+    
+    def flush_archive(self):
+        """Append queued evicted reports to the archive file"""
+        if not self.archive_path or not self._archive_buffer:
+            return
+        
+        with open(self.archive_path, 'a', encoding='utf-8') as archive:
+            for report in self._archive_buffer:
+                public = {key: value for key, value in report.items() if not key.startswith('_')}
+                archive.write(json.dumps(public, default=str) + '\n')
+        self._archive_buffer.clear()
+    
+    @property
+    def version(self) -> int:
+        """Write counter; changes whenever reports or their statuses change"""
+        return self._version
+    
+    def _mark_dirty(self):
+        """Invalidate derived views after a write"""
+        self._reports_df = None
+        self._stats_dirty = True
+        self._version += 1
+    
+    def _generate_report_id(self, now: Optional[datetime] = None) -> str:
         """Generate unique report ID"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        random_str = hashlib.sha256(str(np.random.random()).encode()).hexdigest()[:6]
+        timestamp = (now or datetime.now()).strftime("%Y%m%d%H%M%S")
+        random_str = secrets.token_hex(3)
         return f"REPORT_{timestamp}_{random_str}"
     
     def _calculate_priority(self, report_data: Dict) -> str:
@@ -66,21 +210,12 @@ class CrowdsourcedVigilantNetwork:
         score = 0
         
         # Location-based scoring
-        high_risk_locations = ['Delhi', 'Mumbai', 'Kashmir', 'Punjab', 'Assam']
-        if report_data.get('location') in high_risk_locations:
+        if report_data.get('location') in self._HIGH_RISK_LOCATIONS:
             score += 30
         
         # Threat type scoring
-        threat_types = {
-            'TERRORISM': 50,
-            'CYBER_ATTACK': 40,
-            'MISINFORMATION': 30,
-            'SUSPICIOUS_ACTIVITY': 20,
-            'GENERAL_THREAT': 10
-        }
-        
         threat_type = report_data.get('threat_type', 'GENERAL_THREAT')
-        score += threat_types.get(threat_type, 10)
+        score += self._THREAT_SCORES.get(threat_type, 10)
         
         # Evidence quality
         if report_data.get('evidence_attached'):
@@ -105,47 +240,48 @@ class CrowdsourcedVigilantNetwork:
             return True
         
         # Check location credibility
-        if report_data.get('location') in ['Delhi', 'Mumbai', 'Chennai', 'Kolkata']:
+        if report_data.get('location') in self._AUTO_VERIFY_CITIES:
             return True
         
         # Check if report has multimedia evidence
-        if report_data.get('evidence_type') in ['PHOTO', 'VIDEO', 'AUDIO']:
+        if report_data.get('evidence_type') in self._EVIDENCE_MEDIA:
             return True
         
         return False
     
     def _find_similar_reports(self, report_data: Dict) -> List[Dict]:
         """Find similar reports for verification"""
-        similar = []
-        
-        for report in self.reports[-100:]:  # Check last 100 reports
-            if report['report_id'] == report_data['report_id']:
-                continue
-            
-            # Check location similarity
-            if report.get('location') == report_data.get('location'):
-                similar.append(report)
-            
-            # Check threat type similarity
-            elif report.get('threat_type') == report_data.get('threat_type'):
-                similar.append(report)
-        
-        return similar
-    
-    def _update_user_stats(self, user_id: str):
+        # Only the last SIMILAR_WINDOW reports overall may corroborate
+        oldest_row = self._evicted + len(self.reports) - SIMILAR_WINDOW
+        
+        # Same location or same threat type; keyed by report_id so a report matching both counts once
+        similar = {
+            report['report_id']: report
+            for candidates in (self._by_location.get(report_data.get('location'), ()),
+                               self._by_threat.get(report_data.get('threat_type'), ()))
+            for report in candidates
+            if report['_row'] >= oldest_row and report['report_id'] != report_data['report_id']
+        }
+        
+        # In submission order, as a scan of the recent reports would return them
+        return sorted(similar.values(), key=lambda report: report['_row'])
+    
+    def _update_user_stats(self, user_id: str, now_iso: Optional[str] = None):
         """Update user statistics"""
-        if user_id not in self.users:
-            self.users[user_id] = {
+        now_iso = now_iso or datetime.now().isoformat()
+        user = self.users.get(user_id)
+        if user is None:
+            user = self.users[user_id] = {
                 'reports_submitted': 0,
                 'verified_reports': 0,
                 'reward_points': 0,
                 'trust_score': 50,
-                'first_report_date': datetime.now().isoformat(),
-                'last_report_date': datetime.now().isoformat()
+                'first_report_date': now_iso,
+                'last_report_date': now_iso
             }
         
-        self.users[user_id]['reports_submitted'] += 1
-        self.users[user_id]['last_report_date'] = datetime.now().isoformat()
+        user['reports_submitted'] += 1
+        user['last_report_date'] = now_iso
     
     def _assign_rewards(self, user_id: str, report_data: Dict):
         """Assign rewards for verified report"""
@@ -157,16 +293,16 @@ class CrowdsourcedVigilantNetwork:
     
     def verify_report_manually(self, report_id: str, verifier_info: Dict) -> Dict:
         """Manual verification by law enforcement"""
-        report = next((r for r in self.reports if r['report_id'] == report_id), None)
+        report = self._reports_by_id.get(report_id)
         
         if not report:
             return {'success': False, 'error': 'Report not found'}
         
         # Update report status
-        report['status'] = 'VERIFIED'
+        self._set_status(report, 'VERIFIED')
         report['verified_by'] = verifier_info.get('officer_id')
         report['verification_timestamp'] = datetime.now().isoformat()
-        report['verification_score'] = 95  # Manual verification gets high score
+        self._set_verification_score(report, 95)  # Manual verification gets high score
         
         # Assign rewards
         if 'user_id' in report:
@@ -184,22 +320,30 @@ class CrowdsourcedVigilantNetwork:
     
     def get_dashboard_stats(self) -> Dict:
         """Get crowdsourcing dashboard statistics"""
-        total_reports = len(self.reports)
-        verified_reports = len([r for r in self.reports if r['status'] == 'VERIFIED'])
-        pending_reports = len([r for r in self.reports if r['status'] == 'PENDING_VERIFICATION'])
-        
-        # Top contributors
-        top_contributors = sorted(
-            [(uid, data) for uid, data in self.users.items()],
-            key=lambda x: x[1]['verified_reports'],
-            reverse=True
-        )[:5]
-        
-        # Threat distribution
-        threat_distribution = {}
-        for report in self.reports:
-            threat_type = report.get('threat_type', 'UNKNOWN')
-            threat_distribution[threat_type] = threat_distribution.get(threat_type, 0) + 1
+        if self._stats_dirty:
+            self._cached_stats = self._build_dashboard_stats()
+            self._stats_dirty = False
+        
+        # Police totals change through PoliceIntegration directly, which never
+        # marks this cache dirty; they are O(1) running counts, so read them live.
+        # The nested values are copied so callers cannot edit the cache
+        stats = self._cached_stats
+        return {
+            **stats,
+            'top_contributors': [dict(contributor) for contributor in stats['top_contributors']],
+            'threat_distribution': dict(stats['threat_distribution']),
+            'recent_successes': [dict(success) for success in stats['recent_successes']],
+            'police_integration_stats': self.police_integration.get_stats()
+        }
+    
+    def _build_dashboard_stats(self) -> Dict:
+        """Dashboard statistics derived from the reports and users"""
+        total_reports = self._evicted + len(self.reports)
+        verified_reports = self._status_counts['VERIFIED']
+        pending_reports = self._status_counts['PENDING_VERIFICATION']
+        
+        # Top contributors; a partial sort, since only five are shown
+        top_contributors = nlargest(5, self.users.items(), key=lambda x: x[1]['verified_reports'])
         
         return {
             'total_reports': total_reports,
@@ -217,16 +361,16 @@ class CrowdsourcedVigilantNetwork:
                 }
                 for uid, data in top_contributors
             ],
-            'threat_distribution': threat_distribution,
-            'recent_successes': self._get_recent_successes(),
-            'police_integration_stats': self.police_integration.get_stats()
+            'threat_distribution': dict(self._threat_counts),
+            'recent_successes': self._get_recent_successes()
         }
     
     def _get_recent_successes(self) -> List[Dict]:
         """Get recent successful interventions"""
         successes = []
         
-        for report in self.reports[-20:]:  # Last 20 reports
+        recent = list(islice(reversed(self.reports), 20))  # Last 20 reports
+        for report in reversed(recent):
             if report.get('status') == 'VERIFIED' and report.get('priority') in ['IMMEDIATE', 'HIGH']:
                 successes.append({
                     'date': report['timestamp'][:10],
@@ -237,23 +381,60 @@ class CrowdsourcedVigilantNetwork:
         
         return successes[:5]
     
+    def reports_frame(self) -> pd.DataFrame:
+        """Reports as a columnar DataFrame, rebuilt only after the reports change"""
+        if self._reports_df is None:
+            # Built from the columns, so no per-report dict is touched
+            df = pd.DataFrame(self._cols, columns=REPORT_COLUMNS)
+            for col in ('status', 'priority', 'threat_type', 'location'):
+                df[col] = df[col].astype('category')
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df['evidence_attached'] = df['evidence_attached'].fillna(False).astype(bool)
+            self._reports_df = df
+        return self._reports_df
+    
+    def batch_recompute(self, reports_df: pd.DataFrame) -> pd.DataFrame:
+        """Re-score a frame of reports in one vectorized pass (e.g. after rule changes)"""
+        missing = pd.Series(None, index=reports_df.index, dtype=object)
+        locations = reports_df.get('location', missing)
+        # As plain objects: mapping a categorical column keeps it categorical,
+        # and the fillna default below is not one of its categories
+        threat_types = reports_df.get('threat_type', missing).astype(object)
+        evidence = reports_df.get('evidence_attached', missing).fillna(False).astype(bool).to_numpy()
+        
+        priority_codes, points = _score_batch(
+            locations.isin(self._HIGH_RISK_LOCATIONS).to_numpy(),
+            threat_types.map(self._THREAT_SCORES).fillna(10).to_numpy(dtype=np.int64),
+            evidence,
+            locations.isin(self.rewards_system._HIGH_RISK_LOCATIONS).to_numpy(),
+            np.array([self.rewards_system.reward_rates[level] for level in PRIORITY_LEVELS])
+        )
+        
+        return reports_df.assign(
+            priority=np.asarray(PRIORITY_LEVELS, dtype=object)[priority_codes],
+            reward_points=points
+        )
+    
     def generate_public_report(self) -> Dict:
         """Generate public-facing report (anonymous)"""
+        # (now - ts).days <= 30 holds exactly for reports newer than 31 days ago
+        cutoff = datetime.now() - timedelta(days=31)
+        recent_reports = int((self.reports_frame()['timestamp'] > cutoff).sum())
+        
         return {
             'report_period': f"Last 30 days (as of {datetime.now().strftime('%Y-%m-%d')})",
             'summary': {
-                'citizen_reports_received': len([r for r in self.reports 
-                                                if (datetime.now() - datetime.fromisoformat(r['timestamp'].replace('Z', ''))).days <= 30]),
-                'potential_threats_prevented': np.random.randint(15, 30),
-                'arrests_facilitated': np.random.randint(5, 15),
-                'weapons_recovered': np.random.randint(10, 25),
-                'cyber_attacks_prevented': np.random.randint(20, 40)
+                'citizen_reports_received': recent_reports,
+                'potential_threats_prevented': random.randrange(15, 30),
+                'arrests_facilitated': random.randrange(5, 15),
+                'weapons_recovered': random.randrange(10, 25),
+                'cyber_attacks_prevented': random.randrange(20, 40)
             },
             'citizen_impact': {
-                'rewards_distributed': f"₹{np.random.randint(50000, 200000):,}",
-                'top_contributor_reward': f"₹{np.random.randint(5000, 15000):,}",
-                'certificates_issued': np.random.randint(50, 150),
-                'community_events': np.random.randint(10, 25)
+                'rewards_distributed': f"₹{random.randrange(50000, 200000):,}",
+                'top_contributor_reward': f"₹{random.randrange(5000, 15000):,}",
+                'certificates_issued': random.randrange(50, 150),
+                'community_events': random.randrange(10, 25)
             },
             'safety_tips': [
                 'Report suspicious unattended bags immediately',
@@ -265,9 +446,19 @@ class CrowdsourcedVigilantNetwork:
         }
 
 
+def get_session_network(key: str = 'crowdsourced_network') -> CrowdsourcedVigilantNetwork:
+    """Network kept in st.session_state so reports and cached stats survive reruns"""
+    if key not in st.session_state:
+        st.session_state[key] = CrowdsourcedVigilantNetwork()
+    return st.session_state[key]
+
+
 class RewardSystem:
     """Gamified reward system for citizen reporters"""
     
+    # Reward bonus locations; unlike priority scoring this list has no Assam
+    _HIGH_RISK_LOCATIONS = frozenset({'Delhi', 'Mumbai', 'Kashmir', 'Punjab'})
+    
     def __init__(self):
         self.reward_rates = {
             'IMMEDIATE': 1000,
@@ -282,6 +473,17 @@ class RewardSystem:
             'NATIONAL_PROTECTOR': {'threshold': 25, 'points': 2000},
             'ELITE_GUARDIAN': {'threshold': 50, 'points': 5000}
         }
+        
+        # Badge lists only change at the thresholds: precompute one list per tier
+        self._badge_thresholds = sorted({criteria['threshold'] for criteria in self.badges.values()})
+        self._badge_tiers = [
+            [
+                {'name': badge_name, 'threshold': criteria['threshold'], 'reward_points': criteria['points']}
+                for badge_name, criteria in self.badges.items()
+                if criteria['threshold'] <= tier_threshold
+            ]
+            for tier_threshold in [float('-inf')] + self._badge_thresholds
+        ]
     
     def calculate_points(self, report_data: Dict) -> int:
         """Calculate reward points for a report"""
@@ -292,30 +494,26 @@ class RewardSystem:
             base_points *= 1.5
         
         # Bonus for high-risk location
-        high_risk_locations = ['Delhi', 'Mumbai', 'Kashmir', 'Punjab']
-        if report_data.get('location') in high_risk_locations:
+        if report_data.get('location') in self._HIGH_RISK_LOCATIONS:
             base_points *= 1.3
         
         return int(base_points)
     
     def get_user_badges(self, verified_reports: int) -> List[str]:
         """Get badges earned by user"""
-        badges = []
-        
-        for badge_name, criteria in self.badges.items():
-            if verified_reports >= criteria['threshold']:
-                badges.append({
-                    'name': badge_name,
-                    'threshold': criteria['threshold'],
-                    'reward_points': criteria['points']
-                })
-        
-        return badges
+        # Fresh dicts: the tier lists are shared by every caller
+        return [dict(badge) for badge in self._badge_tiers[bisect_right(self._badge_thresholds, verified_reports)]]
 
 
 class PoliceIntegration:
     """Integration with police control rooms"""
     
+    _ACTION_BY_PRIORITY = {
+        'IMMEDIATE': 'DISPATCH_QUICK_RESPONSE_TEAM',
+        'HIGH': 'INCREASE_PATROLS_AND_INVESTIGATE',
+        'MEDIUM': 'MONITOR_AND_GATHER_INTELLIGENCE'
+    }
+    
     def __init__(self):
         self.police_stations = {
             'Delhi': '100',
@@ -326,65 +524,79 @@ class PoliceIntegration:
             'Hyderabad': '106'
         }
         
-        self.forwarded_reports = []
+        self.forwarded_reports = deque(maxlen=MAX_RESIDENT_REPORTS)
+        # Running totals behind get_stats, over every report ever forwarded
+        self._total_forwarded = 0
+        self._responded = 0
+        self._total_response_time = 0
+        self._active_stations = set()
     
     def forward_to_police(self, report_data: Dict):
         """Forward verified report to police"""
         location = report_data.get('location', 'Unknown')
         
         if location in self.police_stations:
-            police_report = {
-                'report_id': report_data['report_id'],
-                'timestamp': datetime.now().isoformat(),
-                'location': location,
-                'threat_details': report_data.get('description', ''),
-                'priority': report_data.get('priority'),
-                'citizen_report': True,
-                'verification_score': report_data.get('verification_score', 0),
-                'police_station_code': self.police_stations[location],
-                'action_required': self._get_police_action(report_data)
-            }
-            
-            self.forwarded_reports.append(police_report)
-            
             # Simulate police response
-            response_time = np.random.randint(10, 120)  # 10-120 minutes
-            police_report['response_time_minutes'] = response_time
-            police_report['status'] = 'RESPONDED' if response_time < 60 else 'IN_PROGRESS'
-            
+            response_time = random.randrange(10, 120)  # 10-120 minutes
+            police_report = self._build_police_report(report_data, datetime.now().isoformat(), response_time)
+            self._record_forwarded([police_report])
             return police_report
         
         return None
     
+    def forward_many(self, reports_data: List[Dict]) -> List[Dict]:
+        """Forward a batch of verified reports under a single timestamp"""
+        now_iso = datetime.now().isoformat()
+        police_reports = [
+            self._build_police_report(report_data, now_iso, random.randrange(10, 120))
+            for report_data in reports_data
+            if report_data.get('location', 'Unknown') in self.police_stations
+        ]
+        self._record_forwarded(police_reports)
+        return police_reports
+    
+    def _build_police_report(self, report_data: Dict, timestamp: str, response_time: int) -> Dict:
+        """Police report for a citizen report whose location has a station"""
+        return {
+            'report_id': report_data['report_id'],
+            'timestamp': timestamp,
+            'location': report_data['location'],
+            'threat_details': report_data.get('description', ''),
+            'priority': report_data.get('priority'),
+            'citizen_report': True,
+            'verification_score': report_data.get('verification_score', 0),
+            'police_station_code': self.police_stations[report_data['location']],
+            'action_required': self._get_police_action(report_data),
+            'response_time_minutes': response_time,
+            'status': _STATUSES[response_time < 60]
+        }
+    
+    def _record_forwarded(self, police_reports: List[Dict]):
+        """Keep forwarded reports and the running totals behind get_stats"""
+        self.forwarded_reports.extend(police_reports)
+        self._total_forwarded += len(police_reports)
+        self._responded += sum(report['status'] == 'RESPONDED' for report in police_reports)
+        self._total_response_time += sum(report['response_time_minutes'] for report in police_reports)
+        self._active_stations.update(report['police_station_code'] for report in police_reports)
+    
     def _get_police_action(self, report_data: Dict) -> str:
         """Get recommended police action"""
-        priority = report_data.get('priority')
-        
-        if priority == 'IMMEDIATE':
-            return 'DISPATCH_QUICK_RESPONSE_TEAM'
-        elif priority == 'HIGH':
-            return 'INCREASE_PATROLS_AND_INVESTIGATE'
-        elif priority == 'MEDIUM':
-            return 'MONITOR_AND_GATHER_INTELLIGENCE'
-        else:
-            return 'LOG_FOR_FUTURE_REFERENCE'
+        return self._ACTION_BY_PRIORITY.get(report_data.get('priority'), 'LOG_FOR_FUTURE_REFERENCE')
     
     def get_stats(self) -> Dict:
         """Get police integration statistics"""
-        total_forwarded = len(self.forwarded_reports)
+        total_forwarded = self._total_forwarded
         
         if total_forwarded == 0:
             return {'total_forwarded': 0}
         
-        responded = len([r for r in self.forwarded_reports if r.get('status') == 'RESPONDED'])
-        avg_response = np.mean([r.get('response_time_minutes', 60) 
-                               for r in self.forwarded_reports])
+        responded = self._responded
+        avg_response = self._total_response_time / total_forwarded
         
         return {
             'total_forwarded': total_forwarded,
             'responded': responded,
             'response_rate': f"{(responded/total_forwarded*100):.1f}%",
             'avg_response_time': f"{avg_response:.1f} minutes",
-            'police_stations_active': len(set(r.get('police_station_code') 
-                                             for r in self.forwarded_reports))
+            'police_stations_active': len(self._active_stations)
         }
\ No newline at end of file
@@ -3,9 +3,65 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import re
-import json
+import orjson
 from typing import Dict, List, Optional
 import hashlib
+import heapq
+import operator
+
+DEFAULT_SCAN_KEYWORDS = ("agent", "india", "attack", "data", "sell", "buy", "leak", "government")
+
+_THREAT_LEVEL_SCORES = {
+    "CRITICAL": 90,
+    "HIGH": 70,
+    "MEDIUM": 50,
+    "LOW": 30
+}
+
+# Threat levels as small integer codes; code 0 is any unrecognised level
+_THREAT_LEVEL_CODES = {level: code for code, level in enumerate(_THREAT_LEVEL_SCORES, start=1)}
+_THREAT_LEVEL_POINTS = np.array([0, *_THREAT_LEVEL_SCORES.values()], dtype=np.int32)
+
+# Bracket bonuses as lookup tables indexed by how many thresholds a value clears:
+# price strictly above 1000/5000/10000, age at or beyond 24h/72h
+_PRICE_THRESHOLDS = np.array([1000, 5000, 10000], dtype=float)
+_PRICE_BONUS = np.array([0, 10, 15, 20], dtype=np.int32)
+_AGE_THRESHOLDS_HOURS = np.array([24, 72], dtype=float)
+_AGE_BONUS = np.array([20, 10, 0], dtype=np.int32)
+
+_CHANNEL_THREAT_TYPES = [
+    "Radicalization content",
+    "Attack planning",
+    "Weapon trading",
+    "Fake document distribution",
+    "Coordination for illegal activities"
+]
+
+def _score_kernel(level_codes: np.ndarray, prices: np.ndarray, hours_ago: np.ndarray,
+                  has_mentions: np.ndarray) -> np.ndarray:
+    """Threat scores from threat-level codes, prices, ages in hours and agent-mention flags"""
+    # Threat level scoring
+    score = _THREAT_LEVEL_POINTS[level_codes]
+    # Price indication (unparseable prices are NaN and earn nothing)
+    score += _PRICE_BONUS[np.searchsorted(_PRICE_THRESHOLDS, np.nan_to_num(prices, nan=0.0))]
+    # Recency
+    score += _AGE_BONUS[np.searchsorted(_AGE_THRESHOLDS_HOURS, hours_ago, side="right")]
+    # Agent mentions
+    score += has_mentions * np.int32(15)
+    return np.minimum(score, 100)
+
+# Single SHA-256 backend for evidence and block hashes. hashlib's SHA-256 is
+# OpenSSL's, which already picks SHA-NI/AVX2 code from CPUID at load time
+_sha256 = hashlib.sha256
+
+def _batch_sha256(payloads: List[bytes]) -> List[str]:
+    """SHA-256 hex digests for a batch of serialized evidence items"""
+    sha256 = _sha256
+    return [sha256(payload).hexdigest() for payload in payloads]
+
+def _chain_preimage(previous_hash: str, evidence_hash: str, timestamp: str) -> bytes:
+    """Bytes a block hash commits to: previous hash, evidence digest, block timestamp"""
+    return f"{previous_hash}{evidence_hash}{timestamp}".encode()
 
 class DarkWebIntelligence:
     """
@@ -30,12 +86,21 @@ class DarkWebIntelligence:
             "Threema"
         ]
         
-        # Sample dark web data (in real implementation, this would come from APIs)
+        # Sample dark web data (in real implementation, this would come from APIs);
+        # assigning it also builds the feed columns
         self.sample_dark_web_data = self._generate_sample_data()
         
         # Blockchain for evidence (simulated)
         self.evidence_chain = []
         
+        # Totals from the most recent scan, so callers asking only for the top
+        # findings can still report on everything that matched
+        self._last_scan_stats = {"matched": 0, "critical": 0}
+        self._last_channel_stats = {"findings": 0, "telegram": 0}
+        
+        # Generator for the simulated channel and auction feeds
+        self._rng = np.random.default_rng()
+        
     def _generate_sample_data(self):
         """Generate sample dark web intelligence data"""
         return [
@@ -91,84 +156,121 @@ class DarkWebIntelligence:
             }
         ]
     
-    def scan_dark_web(self, keywords: List[str] = None) -> List[Dict]:
-        """Simulate dark web scanning for threats"""
+    @property
+    def sample_dark_web_data(self) -> List[Dict]:
+        """Dark web feed items"""
+        return self._sample_dark_web_data
+    
+    @sample_dark_web_data.setter
+    def sample_dark_web_data(self, items: List[Dict]):
+        # Feed items are immutable once ingested, so derive the scan and scoring
+        # inputs once, as columns kept beside the items (never hashed as evidence)
+        self._sample_dark_web_data = items
+        self._feed = self._feed_columns(items)
+    
+    def _current_feed(self) -> Dict[str, np.ndarray]:
+        """Feed columns, rebuilt if items were added to, removed from or replaced in the feed list"""
+        items = self._sample_dark_web_data
+        built_from = self._feed["items"]
+        if len(built_from) != len(items) or not all(map(operator.is_, built_from, items)):
+            self._feed = self._feed_columns(items)
+        return self._feed
+    
+    def _feed_columns(self, items: List[Dict]) -> Dict[str, np.ndarray]:
+        """Columnar view of feed items for vectorized scanning and scoring"""
+        prices = pd.Series([item["price"] for item in items], dtype=object)
+        return {
+            # The item objects the columns were built from, to spot replaced items
+            "items": list(items),
+            "content_lower": [item["content"].lower() for item in items],
+            "level_code": np.array(
+                [_THREAT_LEVEL_CODES.get(item["threat_level"], 0) for item in items], dtype=np.uint8
+            ),
+            # "N/A" and anything else unparseable becomes NaN and earns no price bonus
+            "price": pd.to_numeric(
+                prices.str.replace("[$,]", "", regex=True), errors="coerce"
+            ).to_numpy(dtype=float),
+            "date_found": np.array([item["date_found"] for item in items], dtype="datetime64[us]"),
+            "has_mentions": np.array([bool(item["agent_mentions"]) for item in items], dtype=bool)
+        }
+    
+    def scan_dark_web(self, keywords: List[str] = None, top_k: Optional[int] = None) -> List[Dict]:
+        """Simulate dark web scanning for threats, optionally keeping only the top_k by score"""
         if keywords is None:
-            keywords = ["agent", "india", "attack", "data", "sell", "buy", "leak", "government"]
+            keywords = DEFAULT_SCAN_KEYWORDS
         
+        # One clock read serves the whole scan: recency scoring and block timestamps
+        now = datetime.now()
+        feed = self._current_feed()
         found_threats = []
+        matched_rows = []
+        matched_keywords = []
         
-        for item in self.sample_dark_web_data:
-            content_lower = item["content"].lower()
-            
+        for row, (item, content_lower) in enumerate(
+                zip(self.sample_dark_web_data, feed["content_lower"])):
             # Check for keywords
             matches = [kw for kw in keywords if kw in content_lower]
             
             if matches:
-                threat_score = self._calculate_threat_score(item)
-                item["threat_score"] = threat_score
-                item["matched_keywords"] = matches
-                item["hash"] = self._create_evidence_hash(item)
-                
-                # Add to blockchain
-                self._add_to_blockchain(item)
-                
                 found_threats.append(item)
+                matched_rows.append(row)
+                matched_keywords.append(matches)
         
-        return sorted(found_threats, key=lambda x: x["threat_score"], reverse=True)
-    
-    def _calculate_threat_score(self, item: Dict) -> int:
-        """Calculate threat score for dark web finding"""
-        score = 0
-        
-        # Threat level scoring
-        threat_level_scores = {
-            "CRITICAL": 90,
-            "HIGH": 70,
-            "MEDIUM": 50,
-            "LOW": 30
-        }
-        
-        score += threat_level_scores.get(item["threat_level"], 0)
-        
-        # Price indication
-        if item["price"] != "N/A":
-            try:
-                price = float(item["price"].replace("$", "").replace(",", ""))
-                if price > 10000:
-                    score += 20
-                elif price > 5000:
-                    score += 15
-                elif price > 1000:
-                    score += 10
-            except:
-                pass
+        # Score every match in one vectorized pass over the feed columns
+        matched_rows = np.array(matched_rows, dtype=np.intp)
+        threat_scores = self._calculate_threat_scores(matched_rows, now)
+        for item, threat_score, matches in zip(found_threats, threat_scores.tolist(), matched_keywords):
+            item["threat_score"] = threat_score
+            item["matched_keywords"] = matches
         
-        # Recency
-        hours_ago = (datetime.now() - item["date_found"]).total_seconds() / 3600
-        if hours_ago < 24:
-            score += 20
-        elif hours_ago < 72:
-            score += 10
+        # Hash all matched evidence in one batch, then chain it in scan order
+        digests = _batch_sha256([self._evidence_bytes(item) for item in found_threats])
+        timestamp = now.isoformat()
+        for item, digest in zip(found_threats, digests):
+            item["hash"] = digest
+            self._add_to_blockchain(item, timestamp)
         
-        # Agent mentions
-        if item["agent_mentions"] and len(item["agent_mentions"]) > 0:
-            score += 15
+        critical_code = _THREAT_LEVEL_CODES["CRITICAL"]
+        self._last_scan_stats = {
+            "matched": len(found_threats),
+            "critical": int(np.count_nonzero(feed["level_code"][matched_rows] == critical_code))
+        }
         
-        return min(score, 100)
+        if top_k is not None:
+            return heapq.nlargest(top_k, found_threats, key=lambda x: x["threat_score"])
+        return sorted(found_threats, key=lambda x: x["threat_score"], reverse=True)
+    
+    def _calculate_threat_scores(self, rows: np.ndarray, now: datetime) -> np.ndarray:
+        """Calculate threat scores for the dark web findings at the given feed rows"""
+        feed = self._feed
+        hours_ago = (np.datetime64(now, "us") - feed["date_found"][rows]) / np.timedelta64(1, "h")
+        return _score_kernel(feed["level_code"][rows], feed["price"][rows], hours_ago,
+                             feed["has_mentions"][rows])
+    
+    def _evidence_bytes(self, item: Dict) -> bytes:
+        """Canonical serialization of an evidence item for hashing"""
+        # The item's own "hash" field holds the digest of everything else
+        content = {key: value for key, value in item.items() if key != "hash"}
+        return orjson.dumps(content, option=orjson.OPT_SORT_KEYS, default=str)
     
     def _create_evidence_hash(self, item: Dict) -> str:
         """Create cryptographic hash for evidence"""
-        evidence_string = json.dumps(item, sort_keys=True, default=str)
-        return hashlib.sha256(evidence_string.encode()).hexdigest()
+        return _sha256(self._evidence_bytes(item)).hexdigest()
     
-    def _add_to_blockchain(self, item: Dict):
+    def _add_to_blockchain(self, item: Dict, timestamp: Optional[str] = None):
         """Add evidence to simulated blockchain"""
+        # The item was hashed during the scan; the block commits to that digest
+        # instead of serializing the whole block again
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        previous_hash = self.evidence_chain[-1]["hash"] if self.evidence_chain else "0"
         block = {
-            "timestamp": datetime.now().isoformat(),
-            "evidence": item,
-            "previous_hash": self.evidence_chain[-1]["hash"] if self.evidence_chain else "0",
-            "hash": self._create_evidence_hash(item)
+            "timestamp": timestamp,
+            # Snapshot: later scans rescore the live feed item in place
+            "evidence": dict(item),
+            "evidence_hash": item["hash"],
+            "previous_hash": previous_hash,
+            "hash": _sha256(_chain_preimage(previous_hash, item["hash"], timestamp)).hexdigest()
         }
         
         self.evidence_chain.append(block)
@@ -182,34 +284,43 @@ class DarkWebIntelligence:
         else:
             channels_to_monitor = [c for c in self.encrypted_channels if channel_type.lower() in c.lower()]
         
-        # Simulated monitoring results
-        monitoring_results = []
+        # Simulated monitoring results (in real implementation, this would use APIs);
+        # draw every column for all channels at once, then pack the rows
+        rng = self._rng
+        threat_counts = rng.integers(1, 5, len(channels_to_monitor))
+        total = int(threat_counts.sum())
+        channels = np.repeat(np.asarray(channels_to_monitor, dtype=object), threat_counts)
+        threats = rng.choice(_CHANNEL_THREAT_TYPES, total)
+        hours_ago = rng.integers(1, 24, total)
+        severities = rng.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"], total,
+                                p=[0.3, 0.4, 0.2, 0.1])
+        encryption_levels = rng.choice(["End-to-End", "Server-Side", "Military Grade"], total)
+        participants = rng.integers(5, 100, total)
+        evidence_captured = rng.random(total) < 0.7
         
-        for channel in channels_to_monitor:
-            # Simulate finding threats (in real implementation, this would use APIs)
-            threat_count = np.random.randint(1, 5)
-            
-            for i in range(threat_count):
-                threat_types = [
-                    "Radicalization content",
-                    "Attack planning",
-                    "Weapon trading",
-                    "Fake document distribution",
-                    "Coordination for illegal activities"
-                ]
-                
-                threat = np.random.choice(threat_types)
-                
-                monitoring_results.append({
-                    "channel": channel,
-                    "threat_type": threat,
-                    "timestamp": datetime.now() - timedelta(hours=np.random.randint(1, 24)),
-                    "severity": np.random.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"], 
-                                                p=[0.3, 0.4, 0.2, 0.1]),
-                    "encryption_level": np.random.choice(["End-to-End", "Server-Side", "Military Grade"]),
-                    "participants": np.random.randint(5, 100),
-                    "evidence_captured": np.random.choice([True, False], p=[0.7, 0.3])
-                })
+        now = datetime.now()
+        monitoring_results = [
+            {
+                "channel": channel,
+                "threat_type": threat,
+                "timestamp": now - timedelta(hours=hours),
+                "severity": severity,
+                "encryption_level": encryption_level,
+                "participants": participant_count,
+                "evidence_captured": captured
+            }
+            for channel, threat, hours, severity, encryption_level, participant_count, captured in zip(
+                channels.tolist(), threats.tolist(), hours_ago.tolist(), severities.tolist(),
+                encryption_levels.tolist(), participants.tolist(), evidence_captured.tolist()
+            )
+        ]
+        
+        # Tally per channel rather than per finding
+        is_telegram = np.array(["Telegram" in c for c in channels_to_monitor], dtype=bool)
+        self._last_channel_stats = {
+            "findings": total,
+            "telegram": int(threat_counts[is_telegram].sum())
+        }
         
         return monitoring_results
     
@@ -224,45 +335,56 @@ class DarkWebIntelligence:
             "Login Credentials"
         ]
         
-        auctions = []
+        # Draw every column for all data types at once
+        n = len(data_types)
+        rng = self._rng
+        record_counts = rng.integers(100, 10000, n)
+        prices_per_record = rng.uniform(0.5, 50.0, n)
+        totals = record_counts * prices_per_record
+        origins = rng.choice(["India", "USA", "China", "Russia", "Brazil"], n)
+        ratings = rng.uniform(3.0, 5.0, n)
+        encryptions = rng.choice(["Encrypted", "Plain Text", "Partially Encrypted"], n)
         
-        for data_type in data_types:
-            record_count = np.random.randint(100, 10000)
-            price_per_record = np.random.uniform(0.5, 50.0)
-            
-            auctions.append({
+        auctions = [
+            {
                 "data_type": data_type,
                 "records_available": record_count,
                 "price_per_record": f"${price_per_record:.2f}",
-                "total_value": f"${record_count * price_per_record:,.2f}",
-                "origin_country": np.random.choice(["India", "USA", "China", "Russia", "Brazil"]),
-                "seller_rating": np.random.uniform(3.0, 5.0),
-                "encryption": np.random.choice(["Encrypted", "Plain Text", "Partially Encrypted"])
-            })
+                "total_value": f"${total:,.2f}",
+                "origin_country": origin,
+                "seller_rating": rating,
+                "encryption": encryption
+            }
+            for data_type, record_count, price_per_record, total, origin, rating, encryption in zip(
+                data_types, record_counts.tolist(), prices_per_record.tolist(), totals.tolist(),
+                origins.tolist(), ratings.tolist(), encryptions.tolist()
+            )
+        ]
         
         # Find Indian data specifically
-        indian_data = []
-        for auction in auctions:
-            if auction["origin_country"] == "India":
-                indian_data.append(auction)
+        indian = origins == "India"
+        indian_data = [auctions[i] for i in np.flatnonzero(indian)]
         
         return {
             "total_auctions_monitored": len(auctions),
             "indian_data_auctions": len(indian_data),
-            "estimated_value_indian_data": f"${sum(float(a['total_value'].replace('$', '').replace(',', '')) for a in indian_data):,.2f}",
-            "most_valuable_data_type": max(auctions, key=lambda x: float(x['total_value'].replace('$', '').replace(',', '')))["data_type"],
+            "estimated_value_indian_data": f"${float(totals[indian].sum()):,.2f}",
+            "most_valuable_data_type": data_types[int(totals.argmax())],
             "auction_details": auctions[:5]  # Top 5 auctions
         }
     
     def generate_intelligence_report(self) -> Dict:
         """Generate comprehensive dark web intelligence report"""
-        dark_web_threats = self.scan_dark_web()
+        # Only the top findings are reported; the scan keeps the totals
+        dark_web_threats = self.scan_dark_web(top_k=5)
+        scan_stats = self._last_scan_stats
         encrypted_threats = self.monitor_encrypted_channels()
         data_auctions = self.analyze_data_auctions()
         
         # Calculate metrics
-        total_threats = len(dark_web_threats) + len(encrypted_threats)
-        critical_threats = len([t for t in dark_web_threats if t["threat_level"] == "CRITICAL"])
+        channel_stats = self._last_channel_stats
+        total_threats = scan_stats["matched"] + channel_stats["findings"]
+        critical_threats = scan_stats["critical"]
         
         # Estimate prevented attacks
         estimated_prevention = {
@@ -282,11 +404,11 @@ class DarkWebIntelligence:
                 "encrypted_channels_monitored": len(self.encrypted_channels),
                 "evidence_collected": len(self.evidence_chain)
             },
-            "dark_web_findings": dark_web_threats[:5],  # Top 5
+            "dark_web_findings": dark_web_threats,  # Top 5
             "encrypted_channel_findings": encrypted_threats[:5],  # Top 5
             "data_auction_analysis": data_auctions,
             "prevention_metrics": estimated_prevention,
-            "recommended_actions": self._generate_recommendations(dark_web_threats, encrypted_threats),
+            "recommended_actions": self._generate_recommendations(scan_stats, channel_stats),
             "blockchain_evidence": {
                 "blocks_in_chain": len(self.evidence_chain),
                 "last_block_hash": self.evidence_chain[-1]["hash"] if self.evidence_chain else "None",
@@ -294,12 +416,12 @@ class DarkWebIntelligence:
             }
         }
     
-    def _generate_recommendations(self, dark_web_threats, encrypted_threats):
-        """Generate law enforcement recommendations"""
+    def _generate_recommendations(self, scan_stats: Dict[str, int], channel_stats: Dict[str, int]):
+        """Generate law enforcement recommendations from scan and channel tallies"""
         recommendations = []
         
         # Based on dark web threats
-        if any(t["threat_level"] == "CRITICAL" for t in dark_web_threats):
+        if scan_stats["critical"] > 0:
             recommendations.append({
                 "priority": "IMMEDIATE",
                 "action": "Coordinate with Cyber Crime Cell for dark web investigation",
@@ -308,8 +430,7 @@ class DarkWebIntelligence:
             })
         
         # Based on encrypted channel threats
-        telegram_threats = [t for t in encrypted_threats if "Telegram" in t["channel"]]
-        if len(telegram_threats) > 3:
+        if channel_stats["telegram"] > 3:
             recommendations.append({
                 "priority": "HIGH",
                 "action": "Request Telegram for channel takedown under IT Act Section 69A",
@@ -337,23 +458,25 @@ class DarkWebIntelligence:
     
     def _verify_blockchain(self) -> bool:
         """Verify blockchain integrity"""
-        if len(self.evidence_chain) < 2:
+        if not self.evidence_chain:
             return True
         
-        for i in range(1, len(self.evidence_chain)):
-            current_block = self.evidence_chain[i]
-            previous_block = self.evidence_chain[i-1]
-            
+        sha256 = _sha256
+        previous_hash = "0"
+        for block in self.evidence_chain:
             # Verify hash linkage
-            if current_block["previous_hash"] != previous_block["hash"]:
+            if block["previous_hash"] != previous_hash:
                 return False
             
-            # Verify current block hash
-            block_copy = current_block.copy()
-            block_copy.pop("hash")
-            calculated_hash = self._create_evidence_hash(block_copy)
+            # Verify the evidence still matches the digest the block committed to
+            if sha256(self._evidence_bytes(block["evidence"])).hexdigest() != block["evidence_hash"]:
+                return False
             
-            if current_block["hash"] != calculated_hash:
+            # Verify current block hash, rebuilt from the block's own fields
+            preimage = _chain_preimage(previous_hash, block["evidence_hash"], block["timestamp"])
+            if sha256(preimage).hexdigest() != block["hash"]:
                 return False
+            
+            previous_hash = block["hash"]
         
         return True
\ No newline at end of file
@@ -1,12 +1,30 @@
+import pandas as pd
+
+_LOC_MAP = {
+    "en": ("Global", 20.5937, 78.9629),
+    "hi": ("India", 20.5937, 78.9629),
+    "ur": ("Pakistan Region", 30.3753, 69.3451),
+    "bn": ("India/Bangladesh", 23.6850, 90.3563),
+    "ta": ("South India", 10.8505, 76.2711)
+}
+
+_UNKNOWN_LOCATION = ("Unknown", 0, 0)
+
+_LOC_TABLE = pd.DataFrame.from_dict(_LOC_MAP, orient="index", columns=["location", "lat", "lon"])
+
 def infer_location(language):
     """
     VERY SAFE heuristic-based location inference
     """
-    mapping = {
-        "en": ("Global", 20.5937, 78.9629),
-        "hi": ("India", 20.5937, 78.9629),
-        "ur": ("Pakistan Region", 30.3753, 69.3451),
-        "bn": ("India/Bangladesh", 23.6850, 90.3563),
-        "ta": ("South India", 10.8505, 76.2711)
-    }
-    return mapping.get(language, ("Unknown", 0, 0))
+    return _LOC_MAP.get(language, _UNKNOWN_LOCATION)
+
+def infer_location_batch(languages):
+    """Vectorized infer_location over a Series of language codes"""
+    languages = pd.Series(languages)
+    locations = _LOC_TABLE.reindex(languages.to_numpy()).fillna({
+        "location": _UNKNOWN_LOCATION[0],
+        "lat": _UNKNOWN_LOCATION[1],
+        "lon": _UNKNOWN_LOCATION[2]
+    })
+    locations.index = languages.index
+    return locations
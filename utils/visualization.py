@@ -2,27 +2,42 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 import numpy as np
+import pandas as pd
 
 class ThreatVisualizer:
     @staticmethod
     def create_timeline(data):
         """Create interactive threat timeline"""
-        # Convert timestamp strings to datetime
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-        data = data.sort_values('timestamp')
-        
-        # Create hourly aggregation
-        hourly_counts = data.groupby(
-            data['timestamp'].dt.floor('H')
-        ).size().reset_index(name='count')
-        
-        # Create threat level aggregation
-        threat_levels = data.groupby(
-            data['timestamp'].dt.floor('H')
-        )['Threat Score'].mean().reset_index(name='avg_threat')
-        
-        # Merge data
-        timeline_data = pd.merge(hourly_counts, threat_levels, on='timestamp')
+        # Convert timestamp strings to datetime, without touching the caller's frame;
+        # columns that are already datetime64 skip the parse
+        timestamps = data['timestamp']
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps)
+        if timestamps.dt.tz is not None:
+            # Bucket by local wall-clock hour, as dt.floor('H') did
+            timestamps = timestamps.dt.tz_localize(None)
+        
+        # Bucket into integer hours and aggregate count and mean in one pass;
+        # np.unique returns the buckets already sorted, so no sort is needed
+        stamps = timestamps.to_numpy()
+        has_time = ~np.isnat(stamps)
+        hours = stamps[has_time].astype('datetime64[h]').astype('int64')
+        bins, inverse = np.unique(hours, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(bins))
+        
+        # Missing scores are left out of the mean, as groupby().mean() does
+        scores = data['Threat Score'].to_numpy(dtype=float)[has_time]
+        scored = ~np.isnan(scores)
+        sums = np.bincount(inverse[scored], weights=scores[scored], minlength=len(bins))
+        scored_counts = np.bincount(inverse[scored], minlength=len(bins))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg_threat = sums / scored_counts
+        
+        timeline_data = pd.DataFrame({
+            'timestamp': bins.astype('datetime64[h]').astype('datetime64[ns]'),
+            'count': counts,
+            'avg_threat': avg_threat
+        })
         
         fig = go.Figure()
         
@@ -96,14 +111,19 @@ class ThreatVisualizer:
                 'value': connection.get('strength', 1)
             })
         
-        # Create network graph using Plotly
-        edge_x = []
-        edge_y = []
-        for edge in edges:
-            x0, y0 = nodes[edge['from']]['x'], nodes[edge['from']]['y']
-            x1, y1 = nodes[edge['to']]['x'], nodes[edge['to']]['y']
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+        # Lay the accounts out evenly on a circle
+        angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+        node_x = np.cos(angles)
+        node_y = np.sin(angles)
+        
+        # Create network graph using Plotly; each edge is a segment followed by
+        # a NaN break, gathered for all edges at once
+        src = np.array([edge['from'] for edge in edges], dtype=np.intp)
+        dst = np.array([edge['to'] for edge in edges], dtype=np.intp)
+        edge_x = np.full(3 * len(edges), np.nan)
+        edge_y = np.full(3 * len(edges), np.nan)
+        edge_x[0::3], edge_x[1::3] = node_x[src], node_x[dst]
+        edge_y[0::3], edge_y[1::3] = node_y[src], node_y[dst]
         
         edge_trace = go.Scatter(
             x=edge_x, y=edge_y,
@@ -112,9 +132,6 @@ class ThreatVisualizer:
             mode='lines'
         )
         
-        node_x = [node['x'] for node in nodes]
-        node_y = [node['y'] for node in nodes]
-        
         node_trace = go.Scatter(
             x=node_x, y=node_y,
             mode='markers+text',